@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 import pandas as pd
 
+from .utils import TICKER_PATTERN, VALID_PERIODS
+
 
 class BaseFinancialCollector(ABC):
     """
@@ -139,9 +141,7 @@ class BaseFinancialCollector(ABC):
         
         # Ticker should be 1-5 uppercase letters/numbers
         # Allow common formats: AAPL, BRK.B, etc.
-        import re
-        pattern = r'^[A-Z0-9]{1,5}(\.[A-Z])?$'
-        return bool(re.match(pattern, ticker.upper()))
+        return bool(TICKER_PATTERN.match(ticker.upper()))
     
     def validate_period(self, period: str) -> bool:
         """
@@ -153,4 +153,4 @@ class BaseFinancialCollector(ABC):
         Returns:
             True if valid, False otherwise
         """
-        return period.lower() in ["annual", "quarter"]
+        return period.lower() in VALID_PERIODS
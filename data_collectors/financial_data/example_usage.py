@@ -33,36 +33,44 @@ def main():
     """
     try:
         # Initialize collector (will load API key from environment)
-        collector = FMPCollector()
+        # Using it as a context manager releases pooled connections on exit
+        with FMPCollector() as collector:
+            # Example: Get income statement for Apple
+            print("\n=== Fetching Income Statement for AAPL ===")
+            income_df = collector.get_income_statement("AAPL", period="annual", limit=5)
+            print(f"Retrieved {len(income_df)} records")
+            if not income_df.empty:
+                print("\nColumns:", income_df.columns.tolist()[:10])  # Show first 10 columns
+                print("\nFirst record date:", income_df.iloc[0].get('date', 'N/A'))
         
-        # Example: Get income statement for Apple
-        print("\n=== Fetching Income Statement for AAPL ===")
-        income_df = collector.get_income_statement("AAPL", period="annual", limit=5)
-        print(f"Retrieved {len(income_df)} records")
-        if not income_df.empty:
-            print("\nColumns:", income_df.columns.tolist()[:10])  # Show first 10 columns
-            print("\nFirst record date:", income_df.iloc[0].get('date', 'N/A'))
+            # Example: Get balance sheet
+            print("\n=== Fetching Balance Sheet for AAPL ===")
+            balance_df = collector.get_balance_sheet("AAPL", period="annual", limit=5)
+            print(f"Retrieved {len(balance_df)} records")
         
-        # Example: Get balance sheet
-        print("\n=== Fetching Balance Sheet for AAPL ===")
-        balance_df = collector.get_balance_sheet("AAPL", period="annual", limit=5)
-        print(f"Retrieved {len(balance_df)} records")
+            # Example: Get cash flow statement
+            print("\n=== Fetching Cash Flow Statement for AAPL ===")
+            cashflow_df = collector.get_cashflow_statement("AAPL", period="annual", limit=5)
+            print(f"Retrieved {len(cashflow_df)} records")
         
-        # Example: Get cash flow statement
-        print("\n=== Fetching Cash Flow Statement for AAPL ===")
-        cashflow_df = collector.get_cashflow_statement("AAPL", period="annual", limit=5)
-        print(f"Retrieved {len(cashflow_df)} records")
+            # Example: Get financial ratios
+            print("\n=== Fetching Financial Ratios for AAPL ===")
+            ratios_df = collector.get_financial_ratios("AAPL", period="annual", limit=5)
+            print(f"Retrieved {len(ratios_df)} records")
         
-        # Example: Get financial ratios
-        print("\n=== Fetching Financial Ratios for AAPL ===")
-        ratios_df = collector.get_financial_ratios("AAPL", period="annual", limit=5)
-        print(f"Retrieved {len(ratios_df)} records")
+            # Example: Get all financials at once
+            print("\n=== Fetching All Financial Data for MSFT ===")
+            all_financials = collector.get_all_financials("MSFT", period="annual", limit=3)
+            for statement_type, df in all_financials.items():
+                print(f"{statement_type}: {len(df)} records")
         
-        # Example: Get all financials at once
-        print("\n=== Fetching All Financial Data for MSFT ===")
-        all_financials = collector.get_all_financials("MSFT", period="annual", limit=3)
-        for statement_type, df in all_financials.items():
-            print(f"{statement_type}: {len(df)} records")
+            # Example: Get all financials for several tickers in parallel
+            print("\n=== Fetching All Financial Data for Multiple Tickers ===")
+            bulk_financials = collector.get_all_financials_bulk(
+                ["AAPL", "MSFT", "GOOGL"], period="annual", limit=3
+            )
+            for ticker, statements in bulk_financials.items():
+                print(f"{ticker}: {', '.join(f'{k}={len(v)}' for k, v in statements.items())}")
         
         print("\n=== Example completed successfully! ===")
         
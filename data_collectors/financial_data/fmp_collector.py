@@ -7,29 +7,56 @@ secure API key handling, error sanitization, and rate limiting.
 """
 
 import os
+import asyncio
+import contextlib
+import itertools
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import aiohttp
 import pandas as pd
 import requests
-from typing import Optional, Dict, List
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from typing import Optional, Dict, List, Tuple, AsyncIterator
+from cachetools import TTLCache
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type
 )
 from requests.exceptions import (
     RequestException,
     Timeout,
+    ChunkedEncodingError,
     ConnectionError as RequestsConnectionError
 )
 
+# orjson parses large FMP responses several times faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# ijson lets large responses be parsed incrementally from the socket
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .base_collector import BaseFinancialCollector
 from .utils import (
     validate_ticker_symbol,
     validate_period,
     validate_limit,
     mask_api_key,
-    sanitize_error_message
+    sanitize_error_message,
+    parse_retry_after,
+    TokenBucket
 )
 
 logger = logging.getLogger(__name__)
@@ -40,6 +67,190 @@ class FMPAPIError(Exception):
     pass
 
 
+class FMPRateLimitError(FMPAPIError):
+    """FMP API error raised on HTTP 429 (rate limit exceeded)."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        # Seconds to wait as requested by the server's Retry-After header
+        self.retry_after = retry_after
+
+
+# Upper bound on a server-requested Retry-After delay
+_MAX_RETRY_AFTER = 60  # seconds
+
+# Full-jitter exponential backoff so parallel workers don't retry in lockstep
+_jittered_backoff = wait_random_exponential(multiplier=0.1, max=10)
+
+
+def _wait_for_retry(retry_state) -> float:
+    """
+    Tenacity wait strategy for FMP requests.
+    
+    Honors the Retry-After header of a 429 response when present,
+    otherwise falls back to jittered exponential backoff.
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, FMPRateLimitError) and error.retry_after is not None:
+        return min(error.retry_after, _MAX_RETRY_AFTER)
+    return _jittered_backoff(retry_state)
+
+
+def _raise_retry_error(retry_state) -> None:
+    """
+    Tenacity retry_error_callback for FMP requests.
+    
+    Re-raises FMP errors (e.g., a final 429) as they are and wraps network
+    errors that outlasted every retry in a sanitized FMPAPIError.
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, FMPAPIError):
+        raise error
+    
+    sanitized_msg = sanitize_error_message(error)
+    logger.error(
+        "FMP API request failed after %d attempts: %s", retry_state.attempt_number, sanitized_msg
+    )
+    raise FMPAPIError(f"Failed to retrieve data from FMP API: {sanitized_msg}") from error
+
+
+# Statement kinds: kind -> (FMP endpoint name, description for logs/errors)
+_ENDPOINTS = {
+    'income_statement': ('income-statement', 'income statement'),
+    'balance_sheet': ('balance-sheet-statement', 'balance sheet'),
+    'cashflow': ('cash-flow-statement', 'cash flow statement'),
+    'ratios': ('ratios', 'financial ratios')
+}
+
+# Date columns in FMP statement responses and their formats
+_DATE_COLUMNS = {
+    'date': '%Y-%m-%d',
+    'fillingDate': '%Y-%m-%d',
+    'acceptedDate': '%Y-%m-%d %H:%M:%S'
+}
+
+# Identifier columns shared by the statement endpoints. Values that repeat
+# on every row are stored as categoricals to save memory and speed up groupby.
+_COMMON_COLUMNS = {
+    'symbol': 'category',
+    'reportedCurrency': 'category',
+    'cik': 'category',
+    'period': 'category',
+    'calendarYear': 'category',
+    'link': 'string',
+    'finalLink': 'string'
+}
+
+# Column dtypes per endpoint. Columns missing from a response are skipped;
+# anything not listed keeps the dtype pandas infers.
+_SCHEMAS = {
+    'income-statement': {
+        **_COMMON_COLUMNS,
+        'revenue': 'float64',
+        'costOfRevenue': 'float64',
+        'grossProfit': 'float64',
+        'researchAndDevelopmentExpenses': 'float64',
+        'sellingGeneralAndAdministrativeExpenses': 'float64',
+        'operatingExpenses': 'float64',
+        'ebitda': 'float64',
+        'operatingIncome': 'float64',
+        'incomeBeforeTax': 'float64',
+        'incomeTaxExpense': 'float64',
+        'netIncome': 'float64',
+        'eps': 'float64',
+        'epsdiluted': 'float64',
+        'weightedAverageShsOut': 'float64',
+        'weightedAverageShsOutDil': 'float64'
+    },
+    'balance-sheet-statement': {
+        **_COMMON_COLUMNS,
+        'cashAndCashEquivalents': 'float64',
+        'totalCurrentAssets': 'float64',
+        'totalAssets': 'float64',
+        'totalCurrentLiabilities': 'float64',
+        'totalLiabilities': 'float64',
+        'totalStockholdersEquity': 'float64',
+        'totalDebt': 'float64',
+        'netDebt': 'float64'
+    },
+    'cash-flow-statement': {
+        **_COMMON_COLUMNS,
+        'netIncome': 'float64',
+        'depreciationAndAmortization': 'float64',
+        'operatingCashFlow': 'float64',
+        'capitalExpenditure': 'float64',
+        'freeCashFlow': 'float64',
+        'dividendsPaid': 'float64',
+        'commonStockRepurchased': 'float64'
+    },
+    'ratios': {
+        **_COMMON_COLUMNS,
+        'currentRatio': 'float64',
+        'quickRatio': 'float64',
+        'grossProfitMargin': 'float64',
+        'operatingProfitMargin': 'float64',
+        'netProfitMargin': 'float64',
+        'returnOnAssets': 'float64',
+        'returnOnEquity': 'float64',
+        'debtEquityRatio': 'float64',
+        'priceEarningsRatio': 'float64',
+        'priceToBookRatio': 'float64',
+        'dividendYield': 'float64'
+    }
+}
+
+
+def _apply_schema(df: pd.DataFrame, endpoint_name: str) -> pd.DataFrame:
+    """
+    Cast known columns of an FMP response DataFrame to explicit dtypes.
+    
+    Args:
+        df: DataFrame built from the raw JSON response
+        endpoint_name: FMP endpoint name (key of _SCHEMAS)
+        
+    Returns:
+        DataFrame with typed columns
+    """
+    schema = _SCHEMAS.get(endpoint_name, {})
+    
+    # Numeric fields are coerced so odd values ("", "N/A") become NaN
+    # instead of failing the whole fetch
+    for col, dtype in schema.items():
+        if dtype == 'float64' and col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+    
+    df = df.astype({
+        col: dtype for col, dtype in schema.items()
+        if dtype != 'float64' and col in df.columns
+    })
+    
+    for col, fmt in _DATE_COLUMNS.items():
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], format=fmt, errors='coerce', cache=True)
+    
+    return df
+
+
+def _is_cacheable_response(response: requests.Response) -> bool:
+    """
+    requests-cache filter: keep FMP error payloads out of the HTTP cache.
+    
+    FMP reports some errors (e.g., "Limit Reach") as HTTP 200 with an
+    {"Error Message": ...} object, so the status code alone is not enough.
+    Statement data is always a JSON array; only object bodies are parsed.
+    """
+    content = response.content
+    if not content or not content.lstrip().startswith(b'{'):
+        return True
+    
+    try:
+        data = _json_loads(content)
+    except ValueError:
+        return False
+    
+    return not (isinstance(data, dict) and 'Error Message' in data)
+
+
 class FMPCollector(BaseFinancialCollector):
     """
     Financial Modeling Prep API collector.
@@ -50,6 +261,9 @@ class FMPCollector(BaseFinancialCollector):
     - Error handling with information sanitization
     - Rate limiting and retry logic
     - HTTPS enforcement
+    
+    Every get_* method has an async aget_* counterpart backed by aiohttp,
+    so independent requests can run concurrently.
     """
     
     BASE_URL = "https://financialmodelingprep.com/api/v3"
@@ -59,12 +273,48 @@ class FMPCollector(BaseFinancialCollector):
     MAX_REQUESTS_PER_MINUTE = 5
     REQUEST_TIMEOUT = 30  # seconds
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Upper bound on worker threads for multi-ticker fetches
+    MAX_BULK_WORKERS = 16
+    
+    # Responses whose Content-Length exceeds this are streamed with ijson
+    # (when installed) instead of being buffered in full before parsing.
+    # Content-Length counts bytes on the wire, i.e. the compressed size for
+    # gzip/br responses. Only used when the HTTP cache is disabled.
+    STREAM_THRESHOLD_BYTES = 256 * 1024
+    
+    # In-memory response cache: statements change quarterly at most
+    CACHE_MAXSIZE = 512
+    CACHE_TTL = 3600  # seconds
+    
+    # Persistent HTTP cache (SQLite): historical statements never change, so
+    # repeat runs can be served from disk instead of the network. Stored in
+    # the user cache directory unless http_cache_path is given.
+    HTTP_CACHE_NAME = "fmp_cache"
+    HTTP_CACHE_EXPIRE = 86400  # seconds
+    
+    DEFAULT_HEADERS = {
+        'User-Agent': 'StockRecommend/1.0',
+        'Accept': 'application/json'
+    }
+    
+    def __init__(
+        self, 
+        api_key: Optional[str] = None, 
+        enable_cache: bool = True,
+        enable_http_cache: bool = True,
+        http_cache_path: Optional[str] = None
+    ):
         """
         Initialize FMP collector.
         
         Args:
             api_key: FMP API key. If not provided, will try to load from environment.
+            enable_cache: Cache parsed API responses in memory for CACHE_TTL seconds.
+            enable_http_cache: Cache HTTP responses on disk for HTTP_CACHE_EXPIRE
+                seconds. Disable together with enable_cache to always hit the
+                network (e.g., in tests).
+            http_cache_path: SQLite file for the HTTP cache. Defaults to
+                HTTP_CACHE_NAME in the user cache directory (e.g., ~/.cache).
             
         Raises:
             ValueError: If API key is not provided and not found in environment
@@ -82,34 +332,193 @@ class FMPCollector(BaseFinancialCollector):
         super().__init__(api_key=api_key)
         self.base_url = self.BASE_URL
         
+        # Reuse one pooled session so repeated requests skip TCP/TLS setup
+        if enable_http_cache:
+            self._session = requests_cache.CachedSession(
+                http_cache_path or self.HTTP_CACHE_NAME,
+                backend='sqlite',
+                # Keep the cache file out of the working directory by default
+                use_cache_dir=http_cache_path is None,
+                expire_after=self.HTTP_CACHE_EXPIRE,
+                allowable_methods=['GET'],
+                stale_if_error=True,
+                cache_control=True,
+                filter_fn=_is_cacheable_response,
+                # Keep the API key out of cache keys and stored responses
+                ignored_parameters=['apikey']
+            )
+        else:
+            self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        )
+        self._session.headers.update(self.DEFAULT_HEADERS)
+        
+        # Token bucket shared by the sync, bulk and async paths: allows short
+        # bursts while holding the long-run rate to MAX_REQUESTS_PER_MINUTE
+        self._rate_limiter = TokenBucket(
+            capacity=self.MAX_REQUESTS_PER_MINUTE,
+            refill_rate=self.MAX_REQUESTS_PER_MINUTE / 60
+        )
+        
+        # Response cache shared by the sync, bulk and async paths
+        self._cache: Optional[TTLCache] = (
+            TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL) if enable_cache else None
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # aiohttp session opened by `async with collector`. It belongs to the
+        # event loop that created it; calls outside that block or on another
+        # loop use a session scoped to the call instead.
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Log initialization (with masked API key)
-        logger.info(f"FMP Collector initialized with API key: {mask_api_key(api_key)}")
+        logger.info("FMP Collector initialized with API key: %s", mask_api_key(api_key))
     
-    def _make_request(
+    def __enter__(self) -> "FMPCollector":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session and release its connections."""
+        self._session.close()
+        
+        if self._async_session is not None and not self._async_session.closed:
+            # An aiohttp session can only be closed from its own event loop
+            logger.warning(
+                "Async session is still open; use 'await collector.aclose()' "
+                "or 'async with collector' to close it"
+            )
+    
+    async def __aenter__(self) -> "FMPCollector":
+        await self.aclose()
+        self._async_session = self._new_async_session()
+        self._async_session_loop = asyncio.get_running_loop()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the aiohttp session opened by `async with collector`."""
+        session, loop = self._async_session, self._async_session_loop
+        self._async_session = None
+        self._async_session_loop = None
+        
+        if session is None or session.closed:
+            return
+        
+        if loop is asyncio.get_running_loop():
+            await session.close()
+        else:
+            logger.warning("Async session belongs to another event loop and cannot be closed here")
+    
+    def _new_async_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session bound to the running event loop."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ssl=True),  # Enforce SSL verification
+            headers=self.DEFAULT_HEADERS
+        )
+    
+    @contextlib.asynccontextmanager
+    async def _async_session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Provide an aiohttp session for one top-level async call.
+        
+        Reuses the session opened by `async with collector` when it belongs
+        to the running event loop. Otherwise a session is opened for the
+        duration of the call and closed afterwards, so the collector can be
+        used from successive asyncio.run() calls.
+        """
+        session = self._async_session
+        if (
+            session is not None
+            and not session.closed
+            and self._async_session_loop is asyncio.get_running_loop()
+        ):
+            yield session
+            return
+        
+        session = self._new_async_session()
+        try:
+            yield session
+        finally:
+            await session.close()
+    
+    def clear_cache(self) -> None:
+        """Drop all cached API responses, in memory and on disk."""
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+        
+        if isinstance(self._session, requests_cache.CachedSession):
+            self._session.cache.clear()
+    
+    def cache_stats(self) -> Dict:
+        """
+        Get response cache statistics.
+        
+        Returns:
+            Dictionary with enabled, hits, misses, size, maxsize and ttl
+        """
+        with self._cache_lock:
+            return {
+                'enabled': self._cache is not None,
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'size': len(self._cache) if self._cache is not None else 0,
+                'maxsize': self.CACHE_MAXSIZE,
+                'ttl': self.CACHE_TTL
+            }
+    
+    def _cache_key(self, url: str, params: Dict) -> Tuple:
+        """Build a cache key from the request, excluding the API key."""
+        return (url, tuple(sorted((k, v) for k, v in params.items() if k != 'apikey')))
+    
+    def _cache_get(self, key: Tuple):
+        """Look up a cached response. Returns None on miss or if caching is disabled."""
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            response = self._cache.get(key)
+            if response is None:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+            return response
+    
+    def _cache_put(self, key: Tuple, response) -> None:
+        """Store a checked response in the cache."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = response
+    
+    def _build_request(
         self, 
         endpoint: str, 
         params: Optional[Dict] = None
-    ) -> Dict:
+    ) -> Tuple[str, Dict]:
         """
-        Make secure HTTP request to FMP API.
-        
-        Security features:
-        - HTTPS enforcement
-        - Timeout protection
-        - Retry logic with exponential backoff
-        - Error sanitization
-        - Input validation
+        Validate endpoint and build the request URL and parameters.
         
         Args:
             endpoint: API endpoint path
             params: Query parameters
             
         Returns:
-            JSON response as dictionary
+            Tuple of (full URL, query parameters including API key)
             
         Raises:
-            FMPAPIError: If API request fails
-            ValueError: If input parameters are invalid
+            ValueError: If endpoint is invalid
         """
         # Validate endpoint
         if not endpoint or not isinstance(endpoint, str):
@@ -127,161 +536,410 @@ class FMPCollector(BaseFinancialCollector):
         request_params = params or {}
         request_params['apikey'] = self.api_key
         
+        return url, request_params
+    
+    def _check_response(self, endpoint: str, response):
+        """
+        Check a parsed FMP response for API-level errors.
+        
+        Args:
+            endpoint: API endpoint path (for logging)
+            response: Parsed JSON response
+            
+        Returns:
+            The response, or an empty list if the API returned no data
+            
+        Raises:
+            FMPAPIError: If the response contains an error message
+        """
+        # Check for API errors in response
+        if isinstance(response, list) and len(response) == 0:
+            logger.warning("Empty response from FMP API for endpoint: %s", endpoint)
+            return []
+        
+        # Check for error messages in response
+        if isinstance(response, dict) and 'Error Message' in response:
+            error_msg = response['Error Message']
+            logger.error("FMP API error: %s", error_msg)
+            raise FMPAPIError(f"API returned error: {error_msg}")
+        
+        return response
+    
+    def _http_error(
+        self, 
+        status_code: int, 
+        detail: str,
+        retry_after: Optional[str] = None
+    ) -> FMPAPIError:
+        """
+        Map an HTTP error status to an FMPAPIError.
+        
+        Args:
+            status_code: HTTP status code
+            detail: Error detail (will be sanitized)
+            retry_after: Retry-After header value, if any
+            
+        Returns:
+            FMPAPIError describing the failure
+        """
+        if status_code == 401:
+            return FMPAPIError("Invalid API key. Please check your FMP_API_KEY.")
+        elif status_code == 403:
+            return FMPAPIError("API access forbidden. Check your API key permissions.")
+        elif status_code == 429:
+            logger.warning("FMP API rate limit exceeded")
+            return FMPRateLimitError(
+                "Rate limit exceeded. Please wait before making more requests.",
+                retry_after=parse_retry_after(retry_after)
+            )
+        elif status_code == 404:
+            return FMPAPIError("Endpoint not found. Check the API endpoint.")
+        else:
+            return FMPAPIError(f"HTTP error {status_code}: {sanitize_error_message(detail)}")
+    
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type(
+            (Timeout, RequestsConnectionError, ChunkedEncodingError, FMPRateLimitError)
+        ),
+        retry_error_callback=_raise_retry_error
+    )
+    def _make_request(
+        self, 
+        endpoint: str, 
+        params: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Make secure HTTP request to FMP API.
+        
+        Security features:
+        - HTTPS enforcement
+        - Timeout protection
+        - Retry logic with jittered exponential backoff
+        - Error sanitization
+        - Input validation
+        
+        Timeouts, connection errors (including bodies cut off mid-read) and
+        rate-limit (429) responses are retried. Once retries are exhausted,
+        and for any other failure, a sanitized FMPAPIError is raised.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            
+        Returns:
+            JSON response as dictionary
+            
+        Raises:
+            FMPAPIError: If API request fails, including after retries
+            ValueError: If input parameters are invalid
+        """
+        url, request_params = self._build_request(endpoint, params)
+        
+        cache_key = self._cache_key(url, request_params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for FMP API endpoint: %s", endpoint)
+            return cached
+        
         # Log request (without API key)
-        logger.debug(f"Making request to FMP API: {endpoint}")
+        logger.debug("Making request to FMP API: %s", endpoint)
+        
+        self._rate_limiter.acquire()
         
         try:
             # Make request with security settings
-            response = self._execute_request(url, request_params)
-            
-            # Check for API errors in response
-            if isinstance(response, list) and len(response) == 0:
-                logger.warning(f"Empty response from FMP API for endpoint: {endpoint}")
-                return []
-            
-            # Check for error messages in response
-            if isinstance(response, dict) and 'Error Message' in response:
-                error_msg = response['Error Message']
-                logger.error(f"FMP API error: {error_msg}")
-                raise FMPAPIError(f"API returned error: {error_msg}")
+            with self._session.get(
+                url,
+                params=request_params,
+                timeout=self.REQUEST_TIMEOUT,
+                verify=True,  # Enforce SSL certificate verification
+                stream=True
+            ) as response:
+                # Check HTTP status
+                response.raise_for_status()
+                
+                # Parse JSON
+                data = self._parse_response(response)
             
-            return response
+            data = self._check_response(endpoint, data)
+            self._cache_put(cache_key, data)
+            return data
             
+        except Timeout:
+            logger.warning("Request timeout for URL: %s", url)
+            raise
+        except (RequestsConnectionError, ChunkedEncodingError) as e:
+            # ChunkedEncodingError: the connection dropped while reading the body
+            logger.warning("Connection error: %s", sanitize_error_message(e))
+            raise
+        except requests.exceptions.HTTPError as e:
+            # Handle specific HTTP errors
+            raise self._http_error(
+                e.response.status_code, str(e), e.response.headers.get('Retry-After')
+            )
         except FMPAPIError:
             raise
         except Exception as e:
             # Sanitize error message before logging/raising
             sanitized_msg = sanitize_error_message(e)
-            logger.error(f"Error making request to FMP API: {sanitized_msg}")
+            logger.error("Error making request to FMP API: %s", sanitized_msg)
             raise FMPAPIError(f"Failed to retrieve data from FMP API: {sanitized_msg}")
     
+    def _parse_response(self, response: requests.Response):
+        """
+        Parse a JSON response body, streaming it when it is large.
+        
+        Small bodies are parsed in one go. Bodies whose Content-Length is
+        above STREAM_THRESHOLD_BYTES are decoded item by item straight from
+        the socket, which avoids holding the raw payload and the parsed
+        records in memory at once. Only top-level arrays are streamed item by
+        item; any other top-level value (such as an error object) is built
+        whole and returned as is.
+        
+        Streaming only happens with enable_cache=False: the persistent HTTP
+        cache reads the whole body to store it. The threshold is compared
+        with the on-the-wire size (compressed when Content-Encoding is set),
+        and chunked responses without Content-Length are always buffered.
+        
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            Parsed JSON response
+        """
+        logger.debug(
+            "Response Content-Encoding: %s (from HTTP cache: %s)",
+            response.headers.get('Content-Encoding', 'identity'),
+            getattr(response, 'from_cache', False)
+        )
+        
+        try:
+            content_length = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = 0
+        
+        # The HTTP cache reads the whole body to store it, so there is
+        # nothing left to stream when it is enabled
+        streamable = ijson is not None and not isinstance(
+            self._session, requests_cache.CachedSession
+        )
+        
+        if streamable and content_length > self.STREAM_THRESHOLD_BYTES:
+            logger.debug("Streaming %d byte response", content_length)
+            # Let urllib3 undo any Content-Encoding before ijson reads the body
+            response.raw.decode_content = True
+            try:
+                events = ijson.parse(response.raw, use_float=True)
+                first = next(events)
+                events = itertools.chain([first], events)
+                if first[1] == 'start_array':
+                    return list(ijson.items(events, 'item'))
+                # Not a statement array (e.g., a large {"Error Message": ...}
+                # object): build it whole so _check_response can inspect it
+                return next(ijson.items(events, ''))
+            except ReadTimeoutError as e:
+                # Reading response.raw bypasses requests' exception wrapping;
+                # map urllib3 errors to what response.content would raise
+                raise requests.exceptions.ReadTimeout(e) from e
+            except ProtocolError as e:
+                raise ChunkedEncodingError(e) from e
+        
+        return _json_loads(response.content)
+    
+    # tenacity runs coroutine functions through AsyncRetrying
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Timeout, RequestsConnectionError)),
-        reraise=True
+        stop=stop_after_attempt(5),
+        wait=_wait_for_retry,
+        retry=retry_if_exception_type(
+            (aiohttp.ClientConnectionError, asyncio.TimeoutError, FMPRateLimitError)
+        ),
+        retry_error_callback=_raise_retry_error
     )
-    def _execute_request(self, url: str, params: Dict) -> Dict:
+    async def _amake_request(
+        self, 
+        session: aiohttp.ClientSession,
+        endpoint: str, 
+        params: Optional[Dict] = None
+    ) -> Dict:
         """
-        Execute HTTP request with retry logic.
+        Async counterpart of _make_request.
         
         Args:
-            url: Full URL
-            params: Request parameters
+            session: aiohttp session from _async_session_scope
+            endpoint: API endpoint path
+            params: Query parameters
             
         Returns:
-            JSON response
+            JSON response as dictionary
             
         Raises:
-            RequestException: If request fails after retries
+            FMPAPIError: If API request fails, including after retries
+            ValueError: If input parameters are invalid
         """
+        url, request_params = self._build_request(endpoint, params)
+        
+        cache_key = self._cache_key(url, request_params)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for FMP API endpoint: %s", endpoint)
+            return cached
+        
+        # Log request (without API key)
+        logger.debug("Making async request to FMP API: %s", endpoint)
+        
+        await self._rate_limiter.aacquire()
+        
         try:
-            response = requests.get(
+            async with session.get(
                 url,
-                params=params,
-                timeout=self.REQUEST_TIMEOUT,
-                verify=True,  # Enforce SSL certificate verification
-                headers={
-                    'User-Agent': 'StockRecommend/1.0',
-                    'Accept': 'application/json'
-                }
-            )
-            
-            # Check HTTP status
-            response.raise_for_status()
+                params=request_params,
+                timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+            ) as response:
+                # Check HTTP status
+                if response.status >= 400:
+                    raise self._http_error(
+                        response.status,
+                        response.reason or "",
+                        response.headers.get('Retry-After')
+                    )
+                
+                logger.debug(
+                    "Response Content-Encoding: %s",
+                    response.headers.get('Content-Encoding', 'identity')
+                )
+                
+                # Parse JSON
+                data = _json_loads(await response.read())
             
-            # Parse JSON
-            return response.json()
+            data = self._check_response(endpoint, data)
+            self._cache_put(cache_key, data)
+            return data
             
-        except Timeout:
-            logger.warning(f"Request timeout for URL: {url}")
+        except asyncio.TimeoutError:
+            logger.warning("Request timeout for URL: %s", url)
             raise
-        except RequestsConnectionError as e:
-            logger.warning(f"Connection error: {sanitize_error_message(e)}")
+        except aiohttp.ClientConnectionError as e:
+            logger.warning("Connection error: %s", sanitize_error_message(e))
             raise
-        except requests.exceptions.HTTPError as e:
-            # Handle specific HTTP errors
-            if e.response.status_code == 401:
-                raise FMPAPIError("Invalid API key. Please check your FMP_API_KEY.")
-            elif e.response.status_code == 403:
-                raise FMPAPIError("API access forbidden. Check your API key permissions.")
-            elif e.response.status_code == 429:
-                raise FMPAPIError("Rate limit exceeded. Please wait before making more requests.")
-            elif e.response.status_code == 404:
-                raise FMPAPIError("Endpoint not found. Check the API endpoint.")
-            else:
-                raise FMPAPIError(f"HTTP error {e.response.status_code}: {sanitize_error_message(e)}")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request exception: {sanitize_error_message(e)}")
-            raise FMPAPIError(f"Request failed: {sanitize_error_message(e)}")
+        except FMPAPIError:
+            raise
+        except Exception as e:
+            # Sanitize error message before logging/raising
+            sanitized_msg = sanitize_error_message(e)
+            logger.error("Error making request to FMP API: %s", sanitized_msg)
+            raise FMPAPIError(f"Failed to retrieve data from FMP API: {sanitized_msg}")
     
-    def get_income_statement(
+    def _prepare_statement_request(
         self, 
+        kind: str, 
         ticker: str, 
-        period: str = "annual",
-        limit: int = 5
-    ) -> pd.DataFrame:
+        period: str,
+        limit: int
+    ) -> Tuple[str, Dict, str, str]:
         """
-        Get income statement data for a ticker.
+        Validate inputs and build the request for a statement kind.
         
         Args:
-            ticker: Stock ticker symbol (e.g., "AAPL")
+            kind: Statement kind (key of _ENDPOINTS)
+            ticker: Stock ticker symbol
             period: "annual" or "quarter"
             limit: Number of periods to retrieve (1-100)
             
         Returns:
-            DataFrame containing income statement data
+            Tuple of (endpoint, params, validated ticker, description)
             
         Raises:
             ValueError: If input parameters are invalid
-            FMPAPIError: If API request fails
         """
+        endpoint_name, description = _ENDPOINTS[kind]
+        
         # Input validation
         ticker = validate_ticker_symbol(ticker)
         period = validate_period(period)
         limit = validate_limit(limit)
         
-        logger.info(f"Fetching income statement for {ticker} ({period}, limit={limit})")
+        logger.info("Fetching %s for %s (%s, limit=%d)", description, ticker, period, limit)
         
-        try:
-            endpoint = f"income-statement/{ticker}"
-            params = {
-                'period': period,
-                'limit': limit
-            }
-            
-            data = self._make_request(endpoint, params)
-            
-            if not data or len(data) == 0:
-                logger.warning(f"No income statement data found for {ticker}")
-                return pd.DataFrame()
+        endpoint = f"{endpoint_name}/{ticker}"
+        params = {
+            'period': period,
+            'limit': limit
+        }
+        return endpoint, params, ticker, description
+    
+    def _build_statement_frame(self, kind: str, ticker: str, data) -> pd.DataFrame:
+        """
+        Convert a statement response to a typed DataFrame.
+        
+        Args:
+            kind: Statement kind (key of _ENDPOINTS)
+            ticker: Validated ticker symbol (for logging)
+            data: Checked JSON response
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
+        Returns:
+            DataFrame containing the statement data (empty if no data)
+        """
+        endpoint_name, description = _ENDPOINTS[kind]
+        
+        if not data or len(data) == 0:
+            logger.warning("No %s data found for %s", description, ticker)
+            return pd.DataFrame()
+        
+        # Convert to DataFrame
+        df = pd.DataFrame(data)
+        df = _apply_schema(df, endpoint_name)
+        
+        logger.info("Successfully retrieved %d %s records for %s", len(df), description, ticker)
+        return df
+    
+    def _fetch_statement(
+        self, 
+        kind: str, 
+        ticker: str, 
+        period: str,
+        limit: int
+    ) -> pd.DataFrame:
+        """
+        Fetch a single financial statement.
+        
+        Args:
+            kind: Statement kind (key of _ENDPOINTS)
+            ticker: Stock ticker symbol
+            period: "annual" or "quarter"
+            limit: Number of periods to retrieve (1-100)
             
-            # Validate DataFrame
-            if df.empty:
-                logger.warning(f"Empty DataFrame returned for {ticker}")
-                return df
+        Returns:
+            DataFrame containing the statement data
             
-            logger.info(f"Successfully retrieved {len(df)} income statement records for {ticker}")
-            return df
+        Raises:
+            ValueError: If input parameters are invalid
+            FMPAPIError: If API request fails
+        """
+        endpoint, params, ticker, description = self._prepare_statement_request(
+            kind, ticker, period, limit
+        )
+        
+        try:
+            data = self._make_request(endpoint, params)
+            return self._build_statement_frame(kind, ticker, data)
             
         except (ValueError, FMPAPIError):
             raise
         except Exception as e:
             sanitized_msg = sanitize_error_message(e)
-            logger.error(f"Unexpected error fetching income statement: {sanitized_msg}")
-            raise FMPAPIError(f"Failed to fetch income statement: {sanitized_msg}")
+            logger.error("Unexpected error fetching %s: %s", description, sanitized_msg)
+            raise FMPAPIError(f"Failed to fetch {description}: {sanitized_msg}")
     
-    def get_balance_sheet(
+    def get_income_statement(
         self, 
         ticker: str, 
         period: str = "annual",
         limit: int = 5
     ) -> pd.DataFrame:
         """
-        Get balance sheet data for a ticker.
+        Get income statement data for a ticker.
         
         Args:
             ticker: Stock ticker symbol (e.g., "AAPL")
@@ -289,44 +947,36 @@ class FMPCollector(BaseFinancialCollector):
             limit: Number of periods to retrieve (1-100)
             
         Returns:
-            DataFrame containing balance sheet data
+            DataFrame containing income statement data
             
         Raises:
             ValueError: If input parameters are invalid
             FMPAPIError: If API request fails
         """
-        # Input validation
-        ticker = validate_ticker_symbol(ticker)
-        period = validate_period(period)
-        limit = validate_limit(limit)
-        
-        logger.info(f"Fetching balance sheet for {ticker} ({period}, limit={limit})")
+        return self._fetch_statement('income_statement', ticker, period, limit)
+    
+    def get_balance_sheet(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> pd.DataFrame:
+        """
+        Get balance sheet data for a ticker.
         
-        try:
-            endpoint = f"balance-sheet-statement/{ticker}"
-            params = {
-                'period': period,
-                'limit': limit
-            }
-            
-            data = self._make_request(endpoint, params)
-            
-            if not data or len(data) == 0:
-                logger.warning(f"No balance sheet data found for {ticker}")
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
+        Args:
+            ticker: Stock ticker symbol (e.g., "AAPL")
+            period: "annual" or "quarter"
+            limit: Number of periods to retrieve (1-100)
             
-            logger.info(f"Successfully retrieved {len(df)} balance sheet records for {ticker}")
-            return df
+        Returns:
+            DataFrame containing balance sheet data
             
-        except (ValueError, FMPAPIError):
-            raise
-        except Exception as e:
-            sanitized_msg = sanitize_error_message(e)
-            logger.error(f"Unexpected error fetching balance sheet: {sanitized_msg}")
-            raise FMPAPIError(f"Failed to fetch balance sheet: {sanitized_msg}")
+        Raises:
+            ValueError: If input parameters are invalid
+            FMPAPIError: If API request fails
+        """
+        return self._fetch_statement('balance_sheet', ticker, period, limit)
     
     def get_cashflow_statement(
         self, 
@@ -349,38 +999,7 @@ class FMPCollector(BaseFinancialCollector):
             ValueError: If input parameters are invalid
             FMPAPIError: If API request fails
         """
-        # Input validation
-        ticker = validate_ticker_symbol(ticker)
-        period = validate_period(period)
-        limit = validate_limit(limit)
-        
-        logger.info(f"Fetching cash flow statement for {ticker} ({period}, limit={limit})")
-        
-        try:
-            endpoint = f"cash-flow-statement/{ticker}"
-            params = {
-                'period': period,
-                'limit': limit
-            }
-            
-            data = self._make_request(endpoint, params)
-            
-            if not data or len(data) == 0:
-                logger.warning(f"No cash flow statement data found for {ticker}")
-                return pd.DataFrame()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-            
-            logger.info(f"Successfully retrieved {len(df)} cash flow records for {ticker}")
-            return df
-            
-        except (ValueError, FMPAPIError):
-            raise
-        except Exception as e:
-            sanitized_msg = sanitize_error_message(e)
-            logger.error(f"Unexpected error fetching cash flow statement: {sanitized_msg}")
-            raise FMPAPIError(f"Failed to fetch cash flow statement: {sanitized_msg}")
+        return self._fetch_statement('cashflow', ticker, period, limit)
     
     def get_financial_ratios(
         self, 
@@ -403,47 +1022,226 @@ class FMPCollector(BaseFinancialCollector):
             ValueError: If input parameters are invalid
             FMPAPIError: If API request fails
         """
-        # Input validation
+        return self._fetch_statement('ratios', ticker, period, limit)
+    
+    def get_all_financials(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get all financial statements at once.
+        
+        The statements are fetched in parallel on a small thread pool that
+        shares the collector's pooled HTTP session.
+        
+        Args:
+            ticker: Stock ticker symbol
+            period: "annual" or "quarter"
+            limit: Number of periods to retrieve
+            
+        Returns:
+            Dictionary containing all financial statements:
+            {
+                'income_statement': DataFrame,
+                'balance_sheet': DataFrame,
+                'cashflow': DataFrame,
+                'ratios': DataFrame
+            }
+        """
+        # Fail fast on invalid input before starting any threads
         ticker = validate_ticker_symbol(ticker)
         period = validate_period(period)
         limit = validate_limit(limit)
         
-        logger.info(f"Fetching financial ratios for {ticker} ({period}, limit={limit})")
+        logger.info("Fetching all financial data for %s", ticker)
         
-        try:
-            endpoint = f"ratios/{ticker}"
-            params = {
-                'period': period,
-                'limit': limit
+        with ThreadPoolExecutor(max_workers=len(_ENDPOINTS)) as ex:
+            futures = {
+                kind: ex.submit(self._fetch_statement, kind, ticker, period, limit)
+                for kind in _ENDPOINTS
             }
+            try:
+                for future in as_completed(futures.values()):
+                    future.result()
+            except Exception:
+                # Don't spend requests on statements that will be discarded
+                for future in futures.values():
+                    future.cancel()
+                raise
+            return {kind: future.result() for kind, future in futures.items()}
+    
+    def get_all_financials_bulk(
+        self, 
+        tickers: List[str], 
+        period: str = "annual",
+        limit: int = 5
+    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """
+        Get all financial statements for several tickers in parallel.
+        
+        Every (ticker, statement) pair is fetched on one thread pool that
+        shares the collector's pooled HTTP session. A ticker with any failed
+        statement is logged and left out of the result instead of aborting
+        the whole batch; its statements that have not started yet are
+        cancelled.
+        
+        Args:
+            tickers: List of stock ticker symbols
+            period: "annual" or "quarter"
+            limit: Number of periods to retrieve
             
-            data = self._make_request(endpoint, params)
+        Returns:
+            Dictionary mapping each successfully fetched ticker to the
+            result of get_all_financials for that ticker
+        """
+        if not tickers:
+            return {}
+        
+        logger.info("Fetching all financial data for %d tickers", len(tickers))
+        
+        # Submit statements directly rather than nesting get_all_financials'
+        # own thread pool inside this one
+        tasks = [(ticker, kind) for ticker in dict.fromkeys(tickers) for kind in _ENDPOINTS]
+        frames: Dict[str, Dict[str, pd.DataFrame]] = {}
+        failed: Dict[str, Exception] = {}
+        
+        def fetch(ticker: str, kind: str) -> Optional[pd.DataFrame]:
+            # Marked from the worker itself so a statement that starts after
+            # the failure is skipped even before the main thread notices
+            if ticker in failed:
+                return None
+            try:
+                return self._fetch_statement(kind, ticker, period, limit)
+            except (ValueError, FMPAPIError) as e:
+                failed.setdefault(ticker, e)
+                raise
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_BULK_WORKERS, len(tasks))) as ex:
+            futures = {ex.submit(fetch, ticker, kind): (ticker, kind) for ticker, kind in tasks}
+            by_ticker: Dict[str, List[Future]] = {}
+            for future, (ticker, _) in futures.items():
+                by_ticker.setdefault(ticker, []).append(future)
             
-            if not data or len(data) == 0:
-                logger.warning(f"No financial ratios found for {ticker}")
-                return pd.DataFrame()
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                ticker, kind = futures[future]
+                try:
+                    frame = future.result()
+                except (ValueError, FMPAPIError):
+                    # Don't spend requests on statements that will be discarded
+                    for pending in by_ticker[ticker]:
+                        pending.cancel()
+                    continue
+                if ticker not in failed:
+                    frames.setdefault(ticker, {})[kind] = frame
+        
+        for ticker, error in failed.items():
+            logger.warning("Skipping %s: %s", ticker, sanitize_error_message(error))
+        
+        results = {
+            ticker: {kind: frames[ticker][kind] for kind in _ENDPOINTS}
+            for ticker in dict.fromkeys(tickers)
+            if ticker in frames and ticker not in failed
+        }
+        
+        logger.info("Successfully retrieved financial data for %d/%d tickers", len(results), len(tickers))
+        return results
+    
+    async def _afetch_statement(
+        self, 
+        session: aiohttp.ClientSession,
+        kind: str, 
+        ticker: str, 
+        period: str,
+        limit: int
+    ) -> pd.DataFrame:
+        """
+        Async version of _fetch_statement.
+        
+        Args:
+            session: aiohttp session from _async_session_scope
+            kind: Statement kind (key of _ENDPOINTS)
+            ticker: Stock ticker symbol
+            period: "annual" or "quarter"
+            limit: Number of periods to retrieve (1-100)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
+        Returns:
+            DataFrame containing the statement data
             
-            logger.info(f"Successfully retrieved {len(df)} financial ratio records for {ticker}")
-            return df
+        Raises:
+            ValueError: If input parameters are invalid
+            FMPAPIError: If API request fails
+        """
+        endpoint, params, ticker, description = self._prepare_statement_request(
+            kind, ticker, period, limit
+        )
+        
+        try:
+            data = await self._amake_request(session, endpoint, params)
+            return self._build_statement_frame(kind, ticker, data)
             
         except (ValueError, FMPAPIError):
             raise
         except Exception as e:
             sanitized_msg = sanitize_error_message(e)
-            logger.error(f"Unexpected error fetching financial ratios: {sanitized_msg}")
-            raise FMPAPIError(f"Failed to fetch financial ratios: {sanitized_msg}")
+            logger.error("Unexpected error fetching %s: %s", description, sanitized_msg)
+            raise FMPAPIError(f"Failed to fetch {description}: {sanitized_msg}")
     
-    def get_all_financials(
+    async def aget_income_statement(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> pd.DataFrame:
+        """Async version of get_income_statement."""
+        async with self._async_session_scope() as session:
+            return await self._afetch_statement(session, 'income_statement', ticker, period, limit)
+    
+    async def aget_balance_sheet(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> pd.DataFrame:
+        """Async version of get_balance_sheet."""
+        async with self._async_session_scope() as session:
+            return await self._afetch_statement(session, 'balance_sheet', ticker, period, limit)
+    
+    async def aget_cashflow_statement(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> pd.DataFrame:
+        """Async version of get_cashflow_statement."""
+        async with self._async_session_scope() as session:
+            return await self._afetch_statement(session, 'cashflow', ticker, period, limit)
+    
+    async def aget_financial_ratios(
+        self, 
+        ticker: str, 
+        period: str = "annual",
+        limit: int = 5
+    ) -> pd.DataFrame:
+        """Async version of get_financial_ratios."""
+        async with self._async_session_scope() as session:
+            return await self._afetch_statement(session, 'ratios', ticker, period, limit)
+    
+    async def aget_all_financials(
         self, 
         ticker: str, 
         period: str = "annual",
         limit: int = 5
     ) -> Dict[str, pd.DataFrame]:
         """
-        Get all financial statements at once.
+        Get all financial statements concurrently.
+        
+        The four endpoints are independent, so they are requested in parallel
+        and total latency is roughly that of the slowest request. If one
+        fails, the others are cancelled before the error is raised.
         
         Args:
             ticker: Stock ticker symbol
@@ -451,19 +1249,28 @@ class FMPCollector(BaseFinancialCollector):
             limit: Number of periods to retrieve
             
         Returns:
-            Dictionary containing all financial statements:
-            {
-                'income_statement': DataFrame,
-                'balance_sheet': DataFrame,
-                'cashflow': DataFrame,
-                'ratios': DataFrame
-            }
+            Dictionary with the same keys as get_all_financials
         """
-        logger.info(f"Fetching all financial data for {ticker}")
+        # Fail fast on invalid input before opening a session
+        ticker = validate_ticker_symbol(ticker)
+        period = validate_period(period)
+        limit = validate_limit(limit)
         
-        return {
-            'income_statement': self.get_income_statement(ticker, period, limit),
-            'balance_sheet': self.get_balance_sheet(ticker, period, limit),
-            'cashflow': self.get_cashflow_statement(ticker, period, limit),
-            'ratios': self.get_financial_ratios(ticker, period, limit)
-        }
+        logger.info("Fetching all financial data for %s (async)", ticker)
+        
+        async with self._async_session_scope() as session:
+            tasks = [
+                asyncio.ensure_future(self._afetch_statement(session, kind, ticker, period, limit))
+                for kind in _ENDPOINTS
+            ]
+            try:
+                frames = await asyncio.gather(*tasks)
+            except BaseException:
+                # gather leaves the other fetches running; stop them before
+                # the session they use is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        
+        return dict(zip(_ENDPOINTS, frames))
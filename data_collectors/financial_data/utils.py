@@ -5,13 +5,31 @@ Contains security-focused validation and helper functions.
 """
 
 import re
+import asyncio
 import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional
-from functools import wraps
 import time
 
 logger = logging.getLogger(__name__)
 
+# Ticker format: 1-5 alphanumeric characters, optionally followed by .[A-Z]
+# Examples: AAPL, BRK.B, GOOGL
+TICKER_PATTERN = re.compile(r'^[A-Z0-9]{1,5}(\.[A-Z])?$')
+
+# Long alphanumeric strings that might be API keys
+_APIKEY_RE = re.compile(r'\b[A-Za-z0-9]{20,}\b')
+
+# File paths that might reveal system structure
+_PATH_RE = re.compile(r'[A-Z]:\\[^\s]+|/[^\s]+')
+
+VALID_PERIODS = frozenset(("annual", "quarter"))
+
+# Error messages mentioning any of these are replaced with a generic message
+_SENSITIVE_KEYWORDS = ('api_key', 'password', 'secret', 'token', 'credential')
+
 
 def validate_ticker_symbol(ticker: str) -> str:
     """
@@ -38,20 +56,14 @@ def validate_ticker_symbol(ticker: str) -> str:
     ticker = ticker.strip().upper()
     
     # Validate format: 1-5 alphanumeric characters, optionally followed by .[A-Z]
-    # Examples: AAPL, BRK.B, GOOGL
-    pattern = r'^[A-Z0-9]{1,5}(\.[A-Z])?$'
-    
-    if not re.match(pattern, ticker):
+    # The pattern is a whitelist, so shell metacharacters (;&|`$()<>) are
+    # rejected here as well
+    if not TICKER_PATTERN.match(ticker):
         raise ValueError(
             f"Invalid ticker format: {ticker}. "
             "Ticker must be 1-5 uppercase letters/numbers, optionally with .[A-Z]"
         )
     
-    # Additional security: Check for potentially dangerous characters
-    dangerous_chars = [';', '&', '|', '`', '$', '(', ')', '<', '>']
-    if any(char in ticker for char in dangerous_chars):
-        raise ValueError(f"Ticker contains invalid characters: {ticker}")
-    
     return ticker
 
 
@@ -73,7 +85,7 @@ def validate_period(period: str) -> str:
     
     period_lower = period.lower().strip()
     
-    if period_lower not in ["annual", "quarter"]:
+    if period_lower not in VALID_PERIODS:
         raise ValueError(f"Invalid period: {period}. Must be 'annual' or 'quarter'")
     
     return period_lower
@@ -140,42 +152,114 @@ def sanitize_error_message(error: Exception) -> str:
     error_msg = str(error)
     
     # Remove potential API keys from error messages
-    # Pattern: looks for long alphanumeric strings that might be API keys
-    api_key_pattern = r'\b[A-Za-z0-9]{20,}\b'
-    error_msg = re.sub(api_key_pattern, '[REDACTED]', error_msg)
+    error_msg = _APIKEY_RE.sub('[REDACTED]', error_msg)
     
     # Remove file paths that might reveal system structure
-    path_pattern = r'[A-Z]:\\[^\s]+|/[^\s]+'
-    error_msg = re.sub(path_pattern, '[PATH_REDACTED]', error_msg)
+    error_msg = _PATH_RE.sub('[PATH_REDACTED]', error_msg)
     
     # Generic error message if original contains sensitive info
-    sensitive_keywords = ['api_key', 'password', 'secret', 'token', 'credential']
-    if any(keyword.lower() in error_msg.lower() for keyword in sensitive_keywords):
+    error_msg_lower = error_msg.lower()
+    if any(keyword in error_msg_lower for keyword in _SENSITIVE_KEYWORDS):
         return "An error occurred while processing the request. Please check logs for details."
     
     return error_msg
 
 
-def rate_limit(max_calls: int = 5, period: float = 1.0):
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
     """
-    Decorator for rate limiting API calls.
+    Parse an HTTP Retry-After header value.
     
     Args:
-        max_calls: Maximum number of calls allowed
-        period: Time period in seconds
+        value: Header value, either delay-seconds or an HTTP-date
+        
+    Returns:
+        Number of seconds to wait (never negative), or None if the value
+        is missing or cannot be parsed
     """
-    min_interval = period / max_calls
-    last_called = [0.0]
-    
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
-            left_to_wait = min_interval - elapsed
-            if left_to_wait > 0:
-                time.sleep(left_to_wait)
-            ret = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return ret
-        return wrapper
-    return decorator
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    Allows bursts of up to `capacity` calls while keeping the long-run rate
+    at `refill_rate` calls per second. Callers block only when the bucket
+    is empty. A single bucket can be shared by threads and coroutines.
+    """
+    
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Initialize the bucket (starts full).
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+            
+        Raises:
+            ValueError: If capacity or refill_rate is not positive
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if refill_rate <= 0:
+            raise ValueError("Refill rate must be positive")
+        
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+        
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._last_refill) * self.refill_rate
+            )
+            self._last_refill = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            
+            return (1 - self._tokens) / self.refill_rate
+    
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            logger.debug("Rate limit reached, waiting %.2fs", wait)
+            time.sleep(wait)
+    
+    async def aacquire(self) -> None:
+        """Async version of acquire that waits without blocking the event loop."""
+        while True:
+            wait = self._try_acquire()
+            if wait <= 0:
+                return
+            logger.debug("Rate limit reached, waiting %.2fs", wait)
+            await asyncio.sleep(wait)
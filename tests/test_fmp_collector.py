@@ -0,0 +1,341 @@
+"""
+Tests for the FMP collector, run against a local mock HTTP server.
+"""
+
+import asyncio
+import json
+import logging
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from tenacity import Future as RetryOutcome
+
+from data_collectors.financial_data import FMPCollector
+from data_collectors.financial_data.fmp_collector import (
+    FMPAPIError,
+    FMPRateLimitError,
+    _wait_for_retry
+)
+from data_collectors.financial_data.utils import TokenBucket
+
+
+class _MockFMPHandler(BaseHTTPRequestHandler):
+    """Serves whatever body the test put on the server."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        self.server.request_count += 1
+        segments = set(self.path.split("?")[0].split("/"))
+        if segments & self.server.missing:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        if self.server.rate_limited:
+            # Answer with 429 first, advertising when to come back
+            self.server.rate_limited -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        time.sleep(self.server.delay)
+        body = json.dumps(self.server.payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        
+        if self.server.truncate_next:
+            # Drop the connection halfway through the body
+            self.server.truncate_next = False
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+            return
+        
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def mock_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockFMPHandler)
+    server.payload = []
+    server.request_count = 0
+    server.truncate_next = False
+    server.missing = set()
+    server.delay = 0
+    server.rate_limited = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_collector(mock_server, tmp_path):
+    collectors = []
+    
+    def factory(**kwargs):
+        kwargs.setdefault("http_cache_path", str(tmp_path / "fmp_cache"))
+        collector = FMPCollector(api_key="x" * 32, **kwargs)
+        collector.base_url = f"http://127.0.0.1:{mock_server.server_port}"
+        collectors.append(collector)
+        return collector
+    
+    yield factory
+    for collector in collectors:
+        collector.close()
+
+
+def test_error_payload_is_not_cached_on_disk(mock_server, make_collector):
+    mock_server.payload = {"Error Message": "Limit Reach"}
+    with pytest.raises(FMPAPIError, match="Limit Reach"):
+        make_collector().get_income_statement("AAPL")
+    
+    # Server recovered: a fresh collector must go back to the network
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    df = make_collector().get_income_statement("AAPL")
+    
+    assert len(df) == 1
+    assert mock_server.request_count == 2
+
+
+def test_statement_data_is_cached_on_disk(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    make_collector().get_income_statement("AAPL")
+    df = make_collector().get_income_statement("AAPL")
+    
+    assert len(df) == 1
+    assert mock_server.request_count == 1
+
+
+def test_http_cache_defaults_to_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+    
+    FMPCollector(api_key="x" * 32).close()
+    
+    assert not list(tmp_path.glob("*.sqlite"))
+    assert list((tmp_path / "xdg").rglob("fmp_cache.sqlite"))
+
+
+def test_disk_cache_can_be_disabled_on_its_own(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_http_cache=False)
+    collector.get_income_statement("AAPL")
+    collector.get_income_statement("AAPL")
+    make_collector(enable_http_cache=False).get_income_statement("AAPL")
+    
+    # The in-memory cache still serves the repeat; nothing persists across collectors
+    assert collector.cache_stats()['hits'] == 1
+    assert mock_server.request_count == 2
+
+
+def test_memory_cache_hit_sends_no_request(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_http_cache=False)
+    
+    first = collector.get_income_statement("AAPL")
+    second = collector.get_income_statement("AAPL")
+    collector.get_income_statement("AAPL", period="quarter")
+    
+    assert second.equals(first)
+    assert mock_server.request_count == 2
+    stats = collector.cache_stats()
+    assert (stats['enabled'], stats['hits'], stats['misses'], stats['size']) == (True, 1, 2, 2)
+
+
+def test_clear_cache_resets_stats_and_refetches(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_http_cache=False)
+    collector.get_income_statement("AAPL")
+    
+    collector.clear_cache()
+    stats = collector.cache_stats()
+    assert (stats['hits'], stats['misses'], stats['size']) == (0, 0, 0)
+    
+    collector.get_income_statement("AAPL")
+    assert mock_server.request_count == 2
+    assert collector.cache_stats()['misses'] == 1
+
+
+def test_memory_cache_can_be_disabled(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    collector.get_income_statement("AAPL")
+    collector.get_income_statement("AAPL")
+    
+    assert mock_server.request_count == 2
+    stats = collector.cache_stats()
+    assert (stats['enabled'], stats['hits'], stats['misses']) == (False, 0, 0)
+
+
+def test_async_api_works_across_event_loops(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    collector._rate_limiter = TokenBucket(capacity=10, refill_rate=10)
+    
+    first = asyncio.run(collector.aget_all_financials("AAPL"))
+    second = asyncio.run(collector.aget_income_statement("MSFT"))
+    
+    assert set(first) == {'income_statement', 'balance_sheet', 'cashflow', 'ratios'}
+    assert len(second) == 1
+
+
+def test_aget_all_financials_cancels_other_fetches_on_failure(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    mock_server.missing = {"ratios"}
+    mock_server.delay = 1
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    
+    async def run():
+        async with collector:
+            with pytest.raises(FMPAPIError, match="not found"):
+                await collector.aget_all_financials("AAPL")
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    
+    assert asyncio.run(run()) == []
+
+
+def test_async_context_manager_reuses_one_session(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    
+    async def run():
+        async with collector:
+            session = collector._async_session
+            await collector.aget_income_statement("AAPL")
+            assert collector._async_session is session
+        assert session.closed
+    
+    asyncio.run(run())
+
+
+def test_aget_all_financials_validates_before_fetching(mock_server, make_collector):
+    collector = make_collector()
+    
+    with pytest.raises(ValueError):
+        asyncio.run(collector.aget_all_financials("A;B"))
+    
+    assert mock_server.request_count == 0
+
+
+def test_non_numeric_values_become_nan(mock_server, make_collector):
+    mock_server.payload = [
+        {"symbol": "AAPL", "date": "2023-09-30", "revenue": "", "eps": "N/A", "netIncome": 5},
+        {"symbol": "AAPL", "date": "2022-09-24", "revenue": 2, "eps": 1.5, "netIncome": None}
+    ]
+    df = make_collector().get_income_statement("AAPL")
+    
+    assert df["revenue"].dtype == "float64"
+    assert df["revenue"].isna().tolist() == [True, False]
+    assert df["eps"].isna().tolist() == [True, False]
+    assert df["netIncome"].tolist()[0] == 5.0
+
+
+@pytest.mark.parametrize("enable_http_cache, stream_threshold", [
+    (False, 1024),  # streamed with ijson
+    (False, FMPCollector.STREAM_THRESHOLD_BYTES),  # buffered
+    (True, FMPCollector.STREAM_THRESHOLD_BYTES)  # read by the HTTP cache
+])
+def test_response_broken_midway_is_retried(
+    mock_server, make_collector, enable_http_cache, stream_threshold
+):
+    mock_server.payload = [
+        {"symbol": "AAPL", "date": "2023-09-30", "revenue": i} for i in range(200)
+    ]
+    mock_server.truncate_next = True
+    collector = make_collector(enable_cache=False, enable_http_cache=enable_http_cache)
+    collector.STREAM_THRESHOLD_BYTES = stream_threshold
+    
+    df = collector.get_income_statement("AAPL")
+    
+    assert len(df) == 200
+    assert mock_server.request_count == 2
+
+
+def test_bulk_cancels_remaining_statements_of_failed_ticker(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    mock_server.missing = {"NOPE"}
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    collector._rate_limiter = TokenBucket(capacity=10, refill_rate=10)
+    collector.MAX_BULK_WORKERS = 1
+    
+    results = collector.get_all_financials_bulk(["NOPE", "AAPL"])
+    
+    assert list(results) == ["AAPL"]
+    # NOPE's first 404 skips its other three statements
+    assert mock_server.request_count == 5
+
+
+def test_large_error_object_is_raised_when_streamed(mock_server, make_collector):
+    mock_server.payload = {"Error Message": "Limit Reach", "detail": "x" * 300_000}
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    
+    with pytest.raises(FMPAPIError, match="Limit Reach"):
+        collector.get_income_statement("AAPL")
+
+
+def test_network_failure_is_wrapped_once_after_retries(make_collector, caplog):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    collector.base_url = f"http://127.0.0.1:{port}"
+    collector._rate_limiter = TokenBucket(capacity=10, refill_rate=10)
+    
+    with caplog.at_level(logging.ERROR), pytest.raises(FMPAPIError, match="Failed to retrieve"):
+        collector.get_income_statement("AAPL")
+    
+    assert "after 5 attempts" in caplog.text
+    assert "Unexpected error" not in caplog.text
+
+
+def _retry_state(error, attempt_number=1):
+    """Minimal tenacity RetryCallState stand-in for wait strategies."""
+    return SimpleNamespace(
+        outcome=RetryOutcome.construct(attempt_number, error, True),
+        attempt_number=attempt_number
+    )
+
+
+@pytest.mark.parametrize("retry_after, expected", [(0.0, 0.0), (7.5, 7.5), (3600.0, 60.0)])
+def test_wait_for_retry_honors_capped_retry_after(retry_after, expected):
+    error = FMPRateLimitError("Rate limit exceeded", retry_after=retry_after)
+    
+    assert _wait_for_retry(_retry_state(error)) == expected
+
+
+@pytest.mark.parametrize("error", [
+    FMPRateLimitError("Rate limit exceeded"),
+    ConnectionError("reset")
+])
+def test_wait_for_retry_falls_back_to_jittered_backoff(error):
+    waits = {_wait_for_retry(_retry_state(error, attempt_number=3)) for _ in range(20)}
+    
+    assert all(0 <= wait <= 0.8 for wait in waits)
+    assert len(waits) > 1
+
+
+def test_rate_limited_request_is_retried_after_retry_after(mock_server, make_collector):
+    mock_server.payload = [{"symbol": "AAPL", "date": "2023-09-30", "revenue": 1}]
+    mock_server.rate_limited = 1
+    collector = make_collector(enable_cache=False, enable_http_cache=False)
+    
+    started = time.monotonic()
+    df = collector.get_income_statement("AAPL")
+    
+    assert len(df) == 1
+    assert mock_server.request_count == 2
+    assert time.monotonic() - started >= 1
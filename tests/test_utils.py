@@ -0,0 +1,137 @@
+"""
+Tests for financial data utility functions.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from data_collectors.financial_data import utils
+from data_collectors.financial_data.utils import (
+    TokenBucket,
+    parse_retry_after,
+    validate_ticker_symbol
+)
+
+
+# Characters the removed blacklist used to reject; the whitelist regex must
+# still reject every one of them
+@pytest.mark.parametrize("char", list(";&|`$()<>"))
+@pytest.mark.parametrize("template", ["A{}", "A{}B", "{}A"])
+def test_validate_ticker_symbol_rejects_dangerous_characters(template, char):
+    with pytest.raises(ValueError, match="Invalid ticker format"):
+        validate_ticker_symbol(template.format(char))
+
+
+@pytest.mark.parametrize("ticker, expected", [
+    ("AAPL", "AAPL"),
+    (" brk.b ", "BRK.B"),
+    ("googl", "GOOGL")
+])
+def test_validate_ticker_symbol_accepts_valid_tickers(ticker, expected):
+    assert validate_ticker_symbol(ticker) == expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120.0),
+    (" 5 ", 5.0),
+    ("0", 0.0),
+    (None, None),
+    ("", None),
+    ("soon", None),
+    ("-5", None)
+])
+def test_parse_retry_after_delay_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    
+    assert 28 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+
+
+def test_parse_retry_after_past_http_date_is_zero():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class _FakeClock:
+    """Stands in for the time module; sleeping advances the clock."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    # Patch utils' reference only, so the asyncio event loop keeps real time
+    monkeypatch.setattr(utils, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+def test_token_bucket_allows_burst_up_to_capacity(clock):
+    bucket = TokenBucket(capacity=3, refill_rate=1)
+    
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+    
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_token_bucket_refills_at_rate(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=2)
+    bucket.acquire()
+    bucket.acquire()
+    
+    clock.now += 0.5
+    bucket.acquire()
+    assert clock.sleeps == []
+    
+    bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_token_bucket_does_not_refill_past_capacity(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=1)
+    clock.now += 3600
+    
+    for _ in range(3):
+        bucket.acquire()
+    
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_token_bucket_aacquire_does_not_block_event_loop(clock):
+    bucket = TokenBucket(capacity=1, refill_rate=100)
+    bucket.acquire()
+    
+    async def run():
+        waiter = asyncio.ensure_future(bucket.aacquire())
+        await asyncio.sleep(0)
+        # Reaching this point while the bucket is empty means the loop is free
+        assert not waiter.done()
+        clock.now += 1
+        await asyncio.wait_for(waiter, timeout=1)
+    
+    asyncio.run(run())
+    assert clock.sleeps == []
+
+
+@pytest.mark.parametrize("capacity, refill_rate", [(0, 1), (1, 0), (1, -1)])
+def test_token_bucket_rejects_invalid_settings(capacity, refill_rate):
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=capacity, refill_rate=refill_rate)